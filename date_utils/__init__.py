@@ -13,12 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
 import datetime
-import calendar
-import time
-from email.utils import parsedate_tz
-
-import pytz
+from functools import lru_cache
 
 
 __all__ = [
@@ -29,31 +26,58 @@ __all__ = [
     'get_week_boundaries',
     'get_month_boundaries',
     'get_years_between_range',
+    'get_dates_between_range_array',
+    'get_week_start_dates_between_range_array',
+    'get_month_start_dates_between_range_array',
     'parse_and_format_date',
     'convert_date_str_to_date',
+    'convert_date_str_to_date_many',
     'convert_date_str_to_utc',
     'convert_date_to_local_date'
 ]
 
 __version__ = '0.1.0'
 
+# Number of days in each month for a non-leap year
+_MDAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Matches dates in the following format: "Wed, 9 Oct 2013 00:39:59 +0200"
+_RFC2822 = re.compile(r'\w{3}, (\d{1,2}) (\w{3}) (\d{4}) '
+                      r'(\d{2}):(\d{2}):(\d{2}) ([+-])(\d{2})(\d{2})')
+
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+# Fixed offset timezone objects for all the 15 minute offsets in the valid
+# range, keyed by offset in seconds
+_TZ_CACHE = {
+    offset: datetime.timezone(datetime.timedelta(seconds=offset), '')
+    for offset in range(-12 * 3600, 14 * 3600 + 1, 900)
+}
+
+
+def _fixed_tz(offset):
+    """
+    Return fixed offset timezone object for the provided offset.
+
+    Objects for all the 15 minute offsets between UTC-12 and UTC+14 are
+    pre-built and shared.
 
-class TZInfo(datetime.tzinfo):
-    def __init__(self, offset):
-        """
-        :param offset: UTC offset in seconds.
-        :type offset: ``int``
-        """
-        self.offset = offset
+    Note: Returned objects are ``datetime.timezone`` instances which carry no
+    DST information so ``dst()`` returns ``None`` and ``tm_isdst`` in the
+    ``timetuple()`` of a date using them is -1.
 
-    def utcoffset(self, dt):
-        return datetime.timedelta(seconds=self.offset)
+    :param offset: UTC offset in seconds.
+    :type offset: ``int``
+    """
+    tzinfo = _TZ_CACHE.get(offset)
 
-    def tzname(self, dt):
-        return ''
+    if tzinfo is None:
+        tzinfo = datetime.timezone(datetime.timedelta(seconds=offset), '')
 
-    def dst(self, dt):
-        return datetime.timedelta(0)
+    return tzinfo
 
 
 def get_min_time(date):
@@ -61,10 +85,13 @@ def get_min_time(date):
     Return minimum time for the provided date.
     Minimum time means hour, minute, second and microsecond are all zero.
     """
-    if isinstance(date, datetime.date):
-        date = datetime.datetime(date.year, date.month, date.day)
+    if type(date) is datetime.datetime:
+        return datetime.datetime(date.year, date.month, date.day,
+                                 tzinfo=date.tzinfo)
 
-    min_date = date.replace(hour=0, minute=0, second=0, microsecond=0)
+    # datetime.date or a subclass of date / datetime
+    min_date = datetime.datetime(date.year, date.month, date.day,
+                                 tzinfo=getattr(date, 'tzinfo', None))
     return min_date
 
 
@@ -75,11 +102,13 @@ def get_max_time(date):
     Maximum time means, hour, minute second and microsecond are at their
     maximum value.
     """
-    if isinstance(date, datetime.date):
-        date = datetime.datetime(date.year, date.month, date.day)
+    if type(date) is datetime.datetime:
+        return datetime.datetime(date.year, date.month, date.day, 23, 59, 59,
+                                 999999, date.tzinfo)
 
-    max_date = date.replace(hour=23, minute=59, second=59,
-                            microsecond=999999)
+    # datetime.date or a subclass of date / datetime
+    max_date = datetime.datetime(date.year, date.month, date.day, 23, 59, 59,
+                                 999999, getattr(date, 'tzinfo', None))
     return max_date
 
 
@@ -98,14 +127,8 @@ def get_week_boundaries(date):
     Return week boundaries (week_date_start, week_date_end) for the provided
     date.
     """
-    date_values = date.isocalendar()
-    week_number = date_values[1]
-
-    # Need to subtract 1 because strptime doesn't expect isoweek
-    values = {'year': date.year, 'week': week_number - 1}
-    result = time.strptime('%(year)s %(week)s 1' % (values), '%Y %W %w')
-
-    date_min = datetime.datetime.fromtimestamp(time.mktime(result))
+    date_min = datetime.datetime(date.year, date.month, date.day)
+    date_min = date_min - datetime.timedelta(days=date.weekday())
     date_max = date_min + datetime.timedelta(days=6)
     date_max = get_max_time(date_max)
     return (date_min, date_max)
@@ -119,7 +142,11 @@ def get_month_boundaries(date):
     year = date.year
     month = date.month
 
-    _, max_day = calendar.monthrange(year, month)
+    if month == 2 and (year % 4 == 0 and (year % 100 != 0 or
+                                          year % 400 == 0)):
+        max_day = 29
+    else:
+        max_day = _MDAYS[month - 1]
 
     date_min = datetime.datetime(year, month, 1)
     date_min = get_min_time(date_min)
@@ -148,21 +175,14 @@ def get_week_start_dates_between_range(date_start, date_end):
     min_date = min_date.date()
 
     difference_days = (date_end - min_date).days
-    week_count = (difference_days / 7)
-
-    dates = []
+    week_count = (difference_days // 7)
 
     if week_count == 0:
         # Doesn't span a single week
-        return dates
-
-    dates.append(min_date)
-
-    for week_num in range(1, week_count):
-        days = (week_num * 7)
-        date = (min_date + datetime.timedelta(days=days))
-        dates.append(date)
+        return []
 
+    one_week = datetime.timedelta(days=7)
+    dates = [min_date + one_week * week_num for week_num in range(week_count)]
     return dates
 
 
@@ -181,19 +201,24 @@ def get_month_start_dates_between_range(date_start, date_end):
              with 1st.
     :rtype: ``list``
     """
-    min_date, _ = get_month_boundaries(date=date_start)
-    min_date = min_date.date()
-    dates = get_dates_between_range(date_start=min_date, date_end=date_end)
-    count = len(dates)
-
     result = []
 
     if date_start.month == date_end.month and date_start.year == date_end.year:
-        return []
+        return result
+
+    year = date_start.year
+    month = date_start.month
+    date = datetime.date(year, month, 1)
+
+    while date < date_end:
+        result.append(date)
+
+        month += 1
+        if month == 13:
+            month = 1
+            year += 1
 
-    for index, date in enumerate(dates):
-        if date.day == 1 and index < (count - 1):
-            result.append(date)
+        date = datetime.date(year, month, 1)
 
     return result
 
@@ -211,17 +236,7 @@ def get_years_between_range(date_start, date_end):
 
     :rtype: ``list`` of ``int``
     """
-    min_year = date_start.year
-    max_year = date_end.year
-
-    diff = (max_year - min_year)
-
-    result = []
-
-    for index in range(0, diff + 1):
-        result.append(min_year + index)
-
-    return result
+    return list(range(date_start.year, date_end.year + 1))
 
 
 def get_dates_between_range(date_start, date_end, reverse=False):
@@ -243,25 +258,106 @@ def get_dates_between_range(date_start, date_end, reverse=False):
     :rtype: ``list``
     """
     difference_days = (date_end - date_start).days
-    dates = []
+    one_day = datetime.timedelta(days=1)
 
-    if reverse:
-        values = range(0, difference_days)
-    else:
-        values = reversed(range(1, difference_days + 1))
+    dates = []
+    date = date_end - one_day * difference_days
 
-    for value in values:
-        date = (date_end - datetime.timedelta(days=value))
+    for _ in range(difference_days):
         dates.append(date)
+        date += one_day
+
+    dates.append(date_end)
 
     if reverse:
-        dates.append(date_start)
-    else:
-        dates.append(date_end)
+        dates.reverse()
 
     return dates
 
 
+def get_dates_between_range_array(date_start, date_end):
+    """
+    Same as ``get_dates_between_range``, but return a NumPy array of
+    ``datetime64[D]`` values instead of a list of date objects.
+
+    Unlike ``get_dates_between_range``, which returns ``[date_end]`` in this
+    case, an empty array is returned if ``date_end`` is before
+    ``date_start``.
+
+    Note: This function requires NumPy.
+
+    :param date_start: Start date.
+    :type date_start: ``datetime.date``
+
+    :param date_end: End date.
+    :type date_end: ``datetime.date``
+
+    :rtype: ``numpy.ndarray``
+    """
+    import numpy as np
+
+    return np.arange(np.datetime64(date_start, 'D'),
+                     np.datetime64(date_end, 'D') + np.timedelta64(1, 'D'),
+                     dtype='datetime64[D]')
+
+
+def get_week_start_dates_between_range_array(date_start, date_end):
+    """
+    Same as ``get_week_start_dates_between_range``, but return a NumPy array
+    of ``datetime64[D]`` values instead of a list of date objects.
+
+    Note: This function requires NumPy.
+
+    :param date_start: Start date.
+    :type date_start: ``datetime.date``
+
+    :param date_end: End date.
+    :type date_end: ``datetime.date``
+
+    :rtype: ``numpy.ndarray``
+    """
+    import numpy as np
+
+    min_date, _ = get_week_boundaries(date=date_start)
+    min_date = min_date.date()
+
+    week_count = ((date_end - min_date).days // 7)
+
+    return (np.datetime64(min_date, 'D') +
+            np.arange(0, week_count * 7, 7, dtype='timedelta64[D]'))
+
+
+def get_month_start_dates_between_range_array(date_start, date_end):
+    """
+    Same as ``get_month_start_dates_between_range``, but return a NumPy array
+    of ``datetime64[D]`` values instead of a list of date objects.
+
+    Note: This function requires NumPy.
+
+    :param date_start: Start date.
+    :type date_start: ``datetime.date``
+
+    :param date_end: End date.
+    :type date_end: ``datetime.date``
+
+    :rtype: ``numpy.ndarray``
+    """
+    import numpy as np
+
+    if date_start.month == date_end.month and date_start.year == date_end.year:
+        return np.array([], dtype='datetime64[D]')
+
+    month_start = np.datetime64(date_start, 'M')
+    month_end = np.datetime64(date_end, 'M')
+
+    if date_end.day > 1:
+        # Month start of the end date falls inside the range
+        month_end = month_end + np.timedelta64(1, 'M')
+
+    months = np.arange(month_start, month_end, dtype='datetime64[M]')
+    return months.astype('datetime64[D]')
+
+
 def parse_and_format_date(value):
     """
     Try to parse a date in either UNIX timestamp or YYYY-mm-dd format.
@@ -271,11 +367,21 @@ def parse_and_format_date(value):
 
     :rtype: ``datetime.date``
     """
-    if isinstance(value, int) or value.isdigit():
-        value = int(value)
+    if isinstance(value, int):
         return datetime.datetime.fromtimestamp(value)
-    else:
-        return datetime.datetime.strptime(value, '%Y-%m-%d')
+    elif value.isdigit():
+        return datetime.datetime.fromtimestamp(int(value))
+
+    if (len(value) == 10 and value[4] == '-' and value[7] == '-' and
+            value[0:4].isdigit() and value[5:7].isdigit() and
+            value[8:10].isdigit()):
+        try:
+            return datetime.datetime(int(value[0:4]), int(value[5:7]),
+                                     int(value[8:10]))
+        except ValueError:
+            pass
+
+    return datetime.datetime.strptime(value, '%Y-%m-%d')
 
 
 def convert_date_str_to_utc(date_str):
@@ -294,6 +400,40 @@ def convert_date_str_to_utc(date_str):
     return date
 
 
+def _datetime_from_rfc2822_match(match):
+    """
+    Return time-zone aware datetime object for the provided ``_RFC2822``
+    regular expression match.
+    """
+    (day, month, year, hour, minute, second, sign, offset_hours,
+     offset_minutes) = match.groups()
+
+    offset = (int(offset_hours) * 3600 + int(offset_minutes) * 60)
+
+    if sign == '-':
+        offset = -offset
+
+    date = datetime.datetime(int(year), _MONTHS[month], int(day),
+                             int(hour), int(minute), int(second),
+                             tzinfo=_fixed_tz(offset))
+    return date
+
+
+def _datetime_from_parsedate_tz(date_str):
+    """
+    Parse date string using the generic RFC 2822 parser and return a
+    time-zone aware datetime object.
+    """
+    from email.utils import parsedate_tz
+
+    parsed = parsedate_tz(date_str)
+    date = datetime.datetime(*parsed[0:6])
+    offset = parsed[-1]
+    tzinfo = _fixed_tz(offset)
+    date = date.replace(tzinfo=tzinfo)
+    return date
+
+
 def convert_date_str_to_date(date_str):
     """
     Convert date string to a time-zone aware datetime object.
@@ -304,12 +444,40 @@ def convert_date_str_to_date(date_str):
 
     :rtype: ``datetime.datetime``
     """
-    parsed = parsedate_tz(date_str)
-    date = datetime.datetime(*parsed[0:6])
-    offset = parsed[-1]
-    tzinfo = TZInfo(offset)
-    date = date.replace(tzinfo=tzinfo)
-    return date
+    match = _RFC2822.match(date_str)
+
+    if match and match.group(2) in _MONTHS:
+        return _datetime_from_rfc2822_match(match)
+
+    # Fall back to the generic parser for other RFC 2822 variants
+    return _datetime_from_parsedate_tz(date_str)
+
+
+def convert_date_str_to_date_many(date_strs):
+    """
+    Convert a list of date strings to time-zone aware datetime objects.
+
+    This is a convenience wrapper which calls ``convert_date_str_to_date`` for
+    each item.
+
+    :param date_strs: Dates in the following format:
+                      "Wed, 9 Oct 2013 00:39:59 +0200"
+    :type date_strs: ``list`` of ``str``
+
+    :rtype: ``list`` of ``datetime.datetime``
+    """
+    return [convert_date_str_to_date(date_str=date_str) for date_str in
+            date_strs]
+
+
+@lru_cache(maxsize=128)
+def _get_tz(name):
+    """
+    Return (cached) pytz timezone object for the provided timezone name.
+    """
+    import pytz
+
+    return pytz.timezone(name)
 
 
 def convert_date_to_local_date(date, timezone):
@@ -325,6 +493,5 @@ def convert_date_to_local_date(date, timezone):
     :return: Date in the provided timezone.
     :rtype: ``datetime.datetime``
     """
-    timezone = pytz.timezone(timezone)
-    result = date.astimezone(timezone)
+    result = date.astimezone(_get_tz(timezone))
     return result
@@ -41,7 +41,11 @@ setup(
     packages=[
         'date_utils'
     ],
+    python_requires='>=3.6',
     install_requires=requirements,
+    extras_require={
+        'numpy': ['numpy']
+    },
     url='https://github.com/Kami/python-date-utils/',
     license='Apache License (2.0)',
     author='Tomaz Muraus',
@@ -54,8 +58,8 @@ setup(
         'Operating System :: OS Independent',
         'License :: OSI Approved :: Apache Software License',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2.6',
-        'Programming Language :: Python :: 2.7',
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
         'Programming Language :: Python :: Implementation :: PyPy',
         'Topic :: Software Development :: Libraries :: Python Modules',
     ]
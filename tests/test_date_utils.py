@@ -2,6 +2,11 @@ import sys
 import datetime
 import unittest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from date_utils import get_min_time, get_max_time
 from date_utils import get_date_boundaries
 from date_utils import get_week_boundaries, get_month_boundaries
@@ -9,8 +14,13 @@ from date_utils import get_dates_between_range
 from date_utils import get_week_start_dates_between_range
 from date_utils import get_month_start_dates_between_range
 from date_utils import get_years_between_range
+from date_utils import get_dates_between_range_array
+from date_utils import get_week_start_dates_between_range_array
+from date_utils import get_month_start_dates_between_range_array
+from date_utils import parse_and_format_date
 from date_utils import convert_date_str_to_utc
 from date_utils import convert_date_str_to_date
+from date_utils import convert_date_str_to_date_many
 from date_utils import convert_date_to_local_date
 
 
@@ -30,6 +40,43 @@ class DateUtilsTestCase(unittest.TestCase):
 
         self.assertEqual(actual, expected)
 
+    def test_min_and_max_time_timezone_aware_date(self):
+        tzinfo = datetime.timezone(datetime.timedelta(hours=2))
+        date = datetime.datetime(2013, 9, 17, 12, 30, 15, 100, tzinfo=tzinfo)
+
+        min_date = get_min_time(date)
+        max_date = get_max_time(date)
+
+        self.assertEqual(min_date,
+                         datetime.datetime(2013, 9, 17, tzinfo=tzinfo))
+        self.assertEqual(max_date,
+                         datetime.datetime(2013, 9, 17, 23, 59, 59, 999999,
+                                           tzinfo=tzinfo))
+        self.assertIs(min_date.tzinfo, tzinfo)
+        self.assertIs(max_date.tzinfo, tzinfo)
+
+    def test_min_and_max_time_date(self):
+        date = datetime.date(2013, 9, 17)
+
+        min_date = get_min_time(date)
+        max_date = get_max_time(date)
+
+        self.assertEqual(min_date, datetime.datetime(2013, 9, 17))
+        self.assertEqual(max_date,
+                         datetime.datetime(2013, 9, 17, 23, 59, 59, 999999))
+        self.assertIsNone(min_date.tzinfo)
+        self.assertIsNone(max_date.tzinfo)
+
+    def test_min_and_max_time_date_subclass(self):
+        class CustomDate(datetime.date):
+            pass
+
+        date = CustomDate(2013, 9, 17)
+
+        self.assertEqual(get_min_time(date), datetime.datetime(2013, 9, 17))
+        self.assertEqual(get_max_time(date),
+                         datetime.datetime(2013, 9, 17, 23, 59, 59, 999999))
+
     def test_get_date_boundaries(self):
         dates = [
             datetime.datetime(2013, 9, 17)
@@ -61,6 +108,10 @@ class DateUtilsTestCase(unittest.TestCase):
             datetime.date(2013, 10, 2),  # Wednesday
             datetime.date(2013, 10, 6),  # Sunday
 
+            # Week 4 (mid-year in a year starting on Friday)
+            datetime.date(2016, 6, 13),  # Monday
+            datetime.date(2016, 6, 15),  # Wednesday
+            datetime.date(2016, 6, 19),  # Sunday
         ]
 
         expected_boundaries = [
@@ -75,6 +126,10 @@ class DateUtilsTestCase(unittest.TestCase):
             # Week 3
             (get_min_time(datetime.datetime(2013, 9, 30)),
              get_max_time(datetime.datetime(2013, 10, 6))),
+
+            # Week 4
+            (get_min_time(datetime.datetime(2016, 6, 13)),
+             get_max_time(datetime.datetime(2016, 6, 19))),
         ]
 
         for index, date in enumerate(dates):
@@ -82,9 +137,26 @@ class DateUtilsTestCase(unittest.TestCase):
                 expected = expected_boundaries[0]
             elif index > 2 and index <= 5:
                 expected = expected_boundaries[1]
-            else:
+            elif index > 5 and index <= 8:
                 expected = expected_boundaries[2]
+            else:
+                expected = expected_boundaries[3]
+
+            boundaries = get_week_boundaries(date=date)
+            self.assertEqual(expected, boundaries)
+
+    def test_get_week_boundaries_spanning_year_boundary(self):
+        values = [
+            (datetime.date(2013, 12, 31), datetime.datetime(2013, 12, 30)),
+            (datetime.date(2014, 1, 5), datetime.datetime(2013, 12, 30)),
+            (datetime.date(2016, 1, 1), datetime.datetime(2015, 12, 28)),
+            (datetime.datetime(2016, 1, 3, 12, 30),
+             datetime.datetime(2015, 12, 28)),
+        ]
 
+        for date, week_start in values:
+            expected = (week_start,
+                        get_max_time(week_start + datetime.timedelta(days=6)))
             boundaries = get_week_boundaries(date=date)
             self.assertEqual(expected, boundaries)
 
@@ -131,6 +203,26 @@ class DateUtilsTestCase(unittest.TestCase):
             boundaries = get_month_boundaries(date=date)
             self.assertEqual(expected, boundaries)
 
+    def test_get_month_boundaries_february(self):
+        values = [
+            # Leap year
+            (datetime.date(2012, 2, 10), 29),
+            # Non-leap year
+            (datetime.date(2013, 2, 10), 28),
+            # Divisible by 100, but not by 400
+            (datetime.date(1900, 2, 10), 28),
+            # Divisible by 400
+            (datetime.date(2000, 2, 10), 29),
+        ]
+
+        for date, max_day in values:
+            expected = (
+                get_min_time(datetime.datetime(date.year, 2, 1)),
+                get_max_time(datetime.datetime(date.year, 2, max_day))
+            )
+            boundaries = get_month_boundaries(date=date)
+            self.assertEqual(expected, boundaries)
+
     def test_get_dates_between_range(self):
         date_end = datetime.datetime.today()
         date_start = (date_end - datetime.timedelta(days=30))
@@ -158,6 +250,35 @@ class DateUtilsTestCase(unittest.TestCase):
                                                datetime.timedelta(days=1)))
         self.assertEqual(result_reversed[30], date_start)
 
+        # Start and end date with a different time of day
+        date_start = datetime.datetime(2013, 9, 1, 10, 0)
+        date_end = datetime.datetime(2013, 9, 3, 8, 0)
+        expected = [datetime.datetime(2013, 9, 2, 8, 0), date_end]
+
+        result_normal = get_dates_between_range(date_start=date_start,
+                                                date_end=date_end,
+                                                reverse=False)
+        result_reversed = get_dates_between_range(date_start=date_start,
+                                                  date_end=date_end,
+                                                  reverse=True)
+
+        self.assertEqual(result_normal, expected)
+        self.assertEqual(result_reversed, list(reversed(expected)))
+
+        # End date before the start date
+        date_start = datetime.date(2013, 9, 20)
+        date_end = datetime.date(2013, 8, 2)
+
+        result_normal = get_dates_between_range(date_start=date_start,
+                                                date_end=date_end,
+                                                reverse=False)
+        result_reversed = get_dates_between_range(date_start=date_start,
+                                                  date_end=date_end,
+                                                  reverse=True)
+
+        self.assertEqual(result_normal, [date_end])
+        self.assertEqual(result_reversed, [date_end])
+
     def test_get_week_start_dates_between_range(self):
         values = [
             # Doesn't span a single week
@@ -215,6 +336,42 @@ class DateUtilsTestCase(unittest.TestCase):
             result = get_month_start_dates_between_range(*args)
             self.assertEqual(result, expected)
 
+    @unittest.skipIf(numpy is None, 'numpy is not available')
+    def test_range_array_functions(self):
+        values = [
+            (datetime.date(2013, 9, 2), datetime.date(2013, 9, 8)),
+            (datetime.date(2013, 9, 4), datetime.date(2013, 10, 1)),
+            (datetime.date(2011, 9, 2), datetime.date(2014, 1, 1)),
+        ]
+        functions = [
+            (get_dates_between_range_array, get_dates_between_range),
+            (get_week_start_dates_between_range_array,
+             get_week_start_dates_between_range),
+            (get_month_start_dates_between_range_array,
+             get_month_start_dates_between_range),
+        ]
+
+        for array_func, list_func in functions:
+            for args in values:
+                result = array_func(*args)
+                expected = list_func(*args)
+
+                self.assertEqual(result.dtype, numpy.dtype('datetime64[D]'))
+                self.assertEqual(result.astype(object).tolist(), expected)
+
+        # End date before the start date
+        date_start = datetime.date(2013, 9, 20)
+        date_end = datetime.date(2013, 8, 2)
+
+        self.assertEqual(len(get_dates_between_range_array(date_start,
+                                                           date_end)), 0)
+        self.assertEqual(
+            len(get_week_start_dates_between_range_array(date_start,
+                                                         date_end)), 0)
+        self.assertEqual(
+            len(get_month_start_dates_between_range_array(date_start,
+                                                          date_end)), 0)
+
     def test_get_years_between_range(self):
         values = [
             # Single year
@@ -231,6 +388,42 @@ class DateUtilsTestCase(unittest.TestCase):
             result = get_years_between_range(*args)
             self.assertEqual(result, expected)
 
+    def test_parse_and_format_date_timestamp(self):
+        expected = datetime.datetime.fromtimestamp(1380000000)
+
+        self.assertEqual(parse_and_format_date(1380000000), expected)
+        self.assertEqual(parse_and_format_date('1380000000'), expected)
+
+        for value in [' 123 ', '1_000', '-123']:
+            self.assertRaises(ValueError, parse_and_format_date, value)
+
+        # Non-int numbers are not supported
+        self.assertRaises((TypeError, AttributeError), parse_and_format_date,
+                          1.5)
+
+    def test_parse_and_format_date_date_string(self):
+        values = [
+            # YYYY-mm-dd fast path
+            ('2013-09-02', datetime.datetime(2013, 9, 2)),
+            # Non zero padded values are handled by strptime
+            ('2013-1-1', datetime.datetime(2013, 1, 1)),
+        ]
+
+        for value, expected in values:
+            self.assertEqual(parse_and_format_date(value), expected)
+
+        invalid_values = [
+            '2013-+1-01',
+            '2013- 1-01',
+            '+013-01-01',
+            '1_00-01-01',
+            '2013-02-30',
+            '2013/09/02',
+        ]
+
+        for value in invalid_values:
+            self.assertRaises(ValueError, parse_and_format_date, value)
+
     def test_convert_date_str_to_utc_and_convert_date_to_local_date(self):
         fmt = '%Y-%m-%d %H:%M:%S %Z%z'
 
@@ -279,6 +472,41 @@ class DateUtilsTestCase(unittest.TestCase):
         date_local = convert_date_to_local_date(date=date2, timezone=timezone)
         self.assertEqual(date_local.strftime(fmt), expected)
 
+    def test_convert_date_str_to_date_fixed_offset_has_no_dst(self):
+        date = convert_date_str_to_date(
+            date_str='Wed, 9 Oct 2013 00:39:59 +0200')
+
+        self.assertEqual(date.utcoffset(), datetime.timedelta(hours=2))
+        self.assertEqual(date.tzname(), '')
+        self.assertIsNone(date.dst())
+        self.assertEqual(date.timetuple().tm_isdst, -1)
+
+    def test_convert_date_str_to_date_non_standard_format(self):
+        fmt = '%Y-%m-%d %H:%M:%S %z'
+
+        # Missing day of the week and lower case month name
+        date_str = '9 oct 2013 00:39:59 +0200'
+        expected = '2013-10-09 00:39:59 +0200'
+
+        date = convert_date_str_to_date(date_str=date_str)
+        self.assertEqual(date.strftime(fmt), expected)
+
+    def test_convert_date_str_to_date_many(self):
+        date_strs = [
+            'Wed, 9 Oct 2013 00:39:59 +0200',
+            'Mon, 09 Sep 2013 17:42:22 -0700',
+            '9 oct 2013 00:39:59 +0200'
+        ]
+
+        expected = [convert_date_str_to_date(date_str=date_str) for
+                    date_str in date_strs]
+        result = convert_date_str_to_date_many(date_strs)
+
+        self.assertEqual(result, expected)
+        self.assertEqual([date.utcoffset() for date in result],
+                         [date.utcoffset() for date in expected])
+        self.assertEqual(convert_date_str_to_date_many([]), [])
+
 
 if __name__ == '__main__':
     sys.exit(unittest.main())